@@ -2,29 +2,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Coroutine
 from dataclasses import dataclass
 from datetime import datetime, time
 from pathlib import Path
 from typing import Any
 
-from homeassistant.components.alarm_control_panel import AlarmControlPanelEntity
-from homeassistant.components.alarm_control_panel.const import (
+from homeassistant.components.alarm_control_panel import (
+    AlarmControlPanelEntity,
     AlarmControlPanelEntityFeature,
-    STATE_ALARM_ARMED_AWAY,
-    STATE_ALARM_ARMED_NIGHT,
-    STATE_ALARM_ARMING,
-    STATE_ALARM_DISARMED,
-    STATE_ALARM_TRIGGERED,
+    AlarmControlPanelState,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_ID, STATE_ON
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers import event as ha_event, template as ha_template
+from homeassistant.helpers import template as ha_template
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import (
     async_track_state_change_event,
     async_track_time_change,
 )
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DEFAULTS,
@@ -108,7 +106,7 @@ class AlarmControl(AlarmControlPanelEntity):
         self.entry = entry
         self._attr_unique_id = entry.entry_id
         self._attr_name = entry.options.get(CONF_NAME, DEFAULTS[CONF_NAME])
-        self._state = STATE_ALARM_DISARMED
+        self._attr_alarm_state = AlarmControlPanelState.DISARMED
         self._attr_code_arm_required = False
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
@@ -119,38 +117,58 @@ class AlarmControl(AlarmControlPanelEntity):
         self._last_trigger: str | None = None
         self._last_snapshot: str | None = None
         self._unsubs: list[callable] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._exit_task: asyncio.Task | None = None
+        self._entry_task: asyncio.Task | None = None
         self._cooldown_until: float = 0.0
 
-    @property
-    def state(self) -> str | None:
-        return self._state
-
-        async def async_added_to_hass(self) -> None:
+    async def async_added_to_hass(self) -> None:
+        await self._rebind()
 
     async def async_will_remove_from_hass(self) -> None:
         for u in self._unsubs:
             u()
         self._unsubs.clear()
+        # exit/entry/duration delays would otherwise outlive the entity
+        tasks = list(self._tasks)
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
 
     # ---- Arm/Disarm API ----
     async def async_alarm_disarm(self, code: str | None = None) -> None:
-        self._set_state(STATE_ALARM_DISARMED)
+        # a pending exit/entry delay must not re-arm or trigger after a disarm
+        self._cancel_delays()
+        self._set_state(AlarmControlPanelState.DISARMED)
         cfg = self._cfg()
         if cfg.armed_helper:
             await self.hass.services.async_call("input_boolean", "turn_off", {"entity_id": cfg.armed_helper}, blocking=False)
         await self._devices_off(cfg)
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
-        await self._arm_with_exit_delay(STATE_ALARM_ARMED_AWAY)
+        await self._arm_with_exit_delay(AlarmControlPanelState.ARMED_AWAY)
 
     async def async_alarm_arm_night(self, code: str | None = None) -> None:
-        await self._arm_with_exit_delay(STATE_ALARM_ARMED_NIGHT)
+        await self._arm_with_exit_delay(AlarmControlPanelState.ARMED_NIGHT)
 
-    async def _arm_with_exit_delay(self, target_state: str) -> None:
+    async def _arm_with_exit_delay(self, target_state: AlarmControlPanelState) -> None:
         cfg = self._cfg()
+        if self._exit_task:
+            self._exit_task.cancel()
+            self._exit_task = None
         if cfg.exit_delay > 0:
-            self._set_state(STATE_ALARM_ARMING)
-            await asyncio.sleep(cfg.exit_delay)
+            self._set_state(AlarmControlPanelState.ARMING)
+            self._exit_task = self._spawn(self._arm_after(cfg.exit_delay, target_state, cfg), "exit_delay")
+            return
+        await self._arm(target_state, cfg)
+
+    async def _arm_after(self, delay: int, target_state: AlarmControlPanelState, cfg: _Config) -> None:
+        await asyncio.sleep(delay)
+        self._exit_task = None
+        await self._arm(target_state, cfg)
+
+    async def _arm(self, target_state: AlarmControlPanelState, cfg: _Config) -> None:
         self._set_state(target_state)
         if cfg.armed_helper:
             await self.hass.services.async_call("input_boolean", "turn_on", {"entity_id": cfg.armed_helper}, blocking=False)
@@ -158,8 +176,8 @@ class AlarmControl(AlarmControlPanelEntity):
     # ---- Config ----
     def _cfg(self) -> _Config:
         opt = {**DEFAULTS, **self.entry.options}
-        t_start = ha_event.parse_time(opt.get(CONF_TIME_START)) if opt.get(CONF_TIME_START) else None
-        t_end = ha_event.parse_time(opt.get(CONF_TIME_END)) if opt.get(CONF_TIME_END) else None
+        t_start = dt_util.parse_time(opt.get(CONF_TIME_START)) if opt.get(CONF_TIME_START) else None
+        t_end = dt_util.parse_time(opt.get(CONF_TIME_END)) if opt.get(CONF_TIME_END) else None
         return _Config(
             name=opt.get(CONF_NAME, DEFAULTS[CONF_NAME]),
             armed_helper=opt.get(CONF_ARMED_HELPER),
@@ -249,19 +267,22 @@ class AlarmControl(AlarmControlPanelEntity):
             return
         new = event.data.get("new_state")
         if new and new.state == STATE_ON:
-            await self._trigger_alarm(source=new)
+            self._spawn(self._trigger_alarm(source=new), "trigger")
 
     async def _on_delayed(self, event) -> None:
         if not self._armed():
             return
         new = event.data.get("new_state")
-        if new and new.state == STATE_ON:
-            cfg = self._cfg()
-            if cfg.entry_delay > 0:
-                await asyncio.sleep(cfg.entry_delay)
-                if not self._armed():
-                    return
-            await self._trigger_alarm(source=new)
+        # one pending entry delay per intrusion, however often the sensor flaps
+        if new and new.state == STATE_ON and not (self._entry_task and not self._entry_task.done()):
+            self._entry_task = self._spawn(self._trigger_after(self._cfg().entry_delay, new), "entry_delay")
+
+    async def _trigger_after(self, delay: int, source: State) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+            if not self._armed():
+                return
+        await self._trigger_alarm(source=source)
 
     async def _on_person_change(self, event) -> None:
         cfg = self._cfg()
@@ -282,7 +303,11 @@ class AlarmControl(AlarmControlPanelEntity):
 
     # ---- Helpers ----
     def _armed(self) -> bool:
-        return self._state in (STATE_ALARM_ARMING, STATE_ALARM_ARMED_AWAY, STATE_ALARM_ARMED_NIGHT)
+        return self._attr_alarm_state in (
+            AlarmControlPanelState.ARMING,
+            AlarmControlPanelState.ARMED_AWAY,
+            AlarmControlPanelState.ARMED_NIGHT,
+        )
 
     def _any_person_home(self, cfg: _Config) -> bool:
         # home or in any safe zone
@@ -303,9 +328,24 @@ class AlarmControl(AlarmControlPanelEntity):
                 return False
         return True
 
-    def _set_state(self, new_state: str) -> None:
-        if self._state != new_state:
-            self._state = new_state
+    def _spawn(self, target: Coroutine[Any, Any, None], name: str) -> asyncio.Task:
+        # run delayed work in a task owned by the entity, never in the caller's task
+        task = self.entry.async_create_background_task(
+            self.hass, target, f"{DOMAIN} {self.entry.entry_id} {name}"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _cancel_delays(self) -> None:
+        for task in (self._exit_task, self._entry_task):
+            if task:
+                task.cancel()
+        self._exit_task = self._entry_task = None
+
+    def _set_state(self, new_state: AlarmControlPanelState) -> None:
+        if self._attr_alarm_state != new_state:
+            self._attr_alarm_state = new_state
             self.async_write_ha_state()
 
     # ---- Alarm pipeline ----
@@ -317,16 +357,18 @@ class AlarmControl(AlarmControlPanelEntity):
             _LOGGER.debug("cooldown active; skip")
             return
 
-        self._set_state(STATE_ALARM_TRIGGERED)
+        self._set_state(AlarmControlPanelState.TRIGGERED)
         if source:
             self._last_trigger = source.entity_id
-        await self._run_actions(source, cfg)
-
-        await asyncio.sleep(cfg.duration)
-        await self._devices_off(cfg)
-
-        if self._state == STATE_ALARM_TRIGGERED:
-            self._set_state(STATE_ALARM_ARMED_AWAY)
+        try:
+            await self._run_actions(source, cfg)
+            await asyncio.sleep(cfg.duration)
+        finally:
+            # also on cancellation (reload/removal), so sirens and lights never stay on
+            await self._devices_off(cfg)
+
+        if self._attr_alarm_state == AlarmControlPanelState.TRIGGERED:
+            self._set_state(AlarmControlPanelState.ARMED_AWAY)
 
         self._cooldown_until = loop.time() + cfg.cooldown
 
@@ -0,0 +1,65 @@
+"""Fixtures for alarmcontrol tests."""
+
+from __future__ import annotations
+
+import pytest
+from custom_components.alarmcontrol.const import (
+    CONF_COOLDOWN,
+    CONF_DELAYED,
+    CONF_DURATION,
+    CONF_ENTRY,
+    CONF_EXIT,
+    CONF_INSTANT,
+    CONF_LIGHTS,
+    CONF_NOTIFY_SERVICES_CSV,
+    CONF_PERSISTENT,
+    CONF_SEND_SNAPSHOT,
+    CONF_SIRENS,
+    DOMAIN,
+)
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_mock_service,
+)
+
+INSTANT_SENSOR = "binary_sensor.front_door"
+DELAYED_SENSOR = "binary_sensor.hallway_motion"
+SIREN = "siren.outdoor"
+LIGHT = "light.hallway"
+
+OPTIONS = {
+    CONF_EXIT: 30,
+    CONF_ENTRY: 15,
+    CONF_DURATION: 120,
+    CONF_COOLDOWN: 60,
+    CONF_INSTANT: [INSTANT_SENSOR],
+    CONF_DELAYED: [DELAYED_SENSOR],
+    CONF_SIRENS: [SIREN],
+    CONF_LIGHTS: [LIGHT],
+    CONF_SEND_SNAPSHOT: False,
+    CONF_NOTIFY_SERVICES_CSV: "",
+    CONF_PERSISTENT: False,
+}
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    yield
+
+
+@pytest.fixture
+def device_calls(hass: HomeAssistant) -> dict[str, list]:
+    """Mock the siren and light services the alarm pipeline calls."""
+    return {
+        f"{domain}.{service}": async_mock_service(hass, domain, service)
+        for domain in ("siren", "light")
+        for service in ("turn_on", "turn_off")
+    }
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(domain=DOMAIN, title="Alarm Control", options=OPTIONS)
+    entry.add_to_hass(hass)
+    return entry
@@ -0,0 +1,57 @@
+"""Shared helpers for driving the alarm entity on a virtual clock."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+from custom_components.alarmcontrol.alarm_control_panel import AlarmControl
+from custom_components.alarmcontrol.const import DOMAIN
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+PANEL_DOMAIN = "alarm_control_panel"
+
+
+async def async_settle(hass: HomeAssistant) -> None:
+    """Let woken background tasks run; async_block_till_done skips them."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+
+
+async def async_advance(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float
+) -> None:
+    """Move the virtual clock forward and fire everything now due."""
+    freezer.tick(timedelta(seconds=seconds))
+    async_fire_time_changed(hass)
+    await async_settle(hass)
+
+
+def panel_entity_id(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    entity_id = er.async_get(hass).async_get_entity_id(
+        PANEL_DOMAIN, DOMAIN, entry.entry_id
+    )
+    assert entity_id is not None
+    return entity_id
+
+
+def panel_entity(hass: HomeAssistant, entry: ConfigEntry) -> AlarmControl:
+    entity = hass.data[PANEL_DOMAIN].get_entity(panel_entity_id(hass, entry))
+    assert isinstance(entity, AlarmControl)
+    return entity
+
+
+async def async_call_panel(
+    hass: HomeAssistant, entry: ConfigEntry, service: str
+) -> None:
+    await hass.services.async_call(
+        PANEL_DOMAIN,
+        service,
+        {"entity_id": panel_entity_id(hass, entry)},
+        blocking=True,
+    )
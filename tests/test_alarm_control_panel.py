@@ -0,0 +1,140 @@
+"""Tests for the alarm control panel entity lifecycle."""
+
+from __future__ import annotations
+
+from custom_components.alarmcontrol.const import CONF_COOLDOWN
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.alarm_control_panel import AlarmControlPanelState
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .conftest import DELAYED_SENSOR, INSTANT_SENSOR, SIREN
+from .helpers import async_advance, async_call_panel, async_settle, panel_entity
+
+
+async def _async_reload_with_new_options(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> None:
+    hass.config_entries.async_update_entry(
+        entry,
+        options={**entry.options, CONF_COOLDOWN: entry.options[CONF_COOLDOWN] + 1},
+    )
+    await async_settle(hass)
+
+
+async def test_exit_delay_does_not_block_caller(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    config_entry: MockConfigEntry,
+    device_calls: dict[str, list],
+) -> None:
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    entity = panel_entity(hass, config_entry)
+
+    await async_call_panel(hass, config_entry, "alarm_arm_away")
+    assert entity.state == AlarmControlPanelState.ARMING
+    assert len(entity._tasks) == 1
+
+    await async_advance(hass, freezer, 31)
+    assert entity.state == AlarmControlPanelState.ARMED_AWAY
+    assert not entity._tasks
+
+
+async def test_reload_during_exit_delay_cancels_owned_task(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    config_entry: MockConfigEntry,
+    device_calls: dict[str, list],
+) -> None:
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    old = panel_entity(hass, config_entry)
+
+    await async_call_panel(hass, config_entry, "alarm_arm_away")
+    (task,) = old._tasks
+
+    await _async_reload_with_new_options(hass, config_entry)
+    assert task.cancelled()
+    assert not old._tasks
+    assert not old._unsubs
+    assert panel_entity(hass, config_entry) is not old
+
+
+async def test_reload_during_alarm_switches_devices_off(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    config_entry: MockConfigEntry,
+    device_calls: dict[str, list],
+) -> None:
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    entity = panel_entity(hass, config_entry)
+
+    await async_call_panel(hass, config_entry, "alarm_arm_away")
+    await async_advance(hass, freezer, 31)
+    hass.states.async_set(INSTANT_SENSOR, STATE_ON)
+    await async_settle(hass)
+    assert entity.state == AlarmControlPanelState.TRIGGERED
+    assert [c.data["entity_id"] for c in device_calls["siren.turn_on"]] == [[SIREN]]
+    assert not device_calls["siren.turn_off"]
+
+    await _async_reload_with_new_options(hass, config_entry)
+    assert not entity._tasks
+    assert [c.data["entity_id"] for c in device_calls["siren.turn_off"]] == [[SIREN]]
+    assert device_calls["light.turn_off"]
+
+    # the reloaded entity starts disarmed and ignores the sensor
+    new = panel_entity(hass, config_entry)
+    hass.states.async_set(INSTANT_SENSOR, STATE_OFF)
+    hass.states.async_set(INSTANT_SENSOR, STATE_ON)
+    await async_settle(hass)
+    assert new.state == AlarmControlPanelState.DISARMED
+    assert not new._tasks
+    assert len(device_calls["siren.turn_on"]) == 1
+
+
+async def test_disarm_during_exit_delay_stays_disarmed(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    config_entry: MockConfigEntry,
+    device_calls: dict[str, list],
+) -> None:
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    entity = panel_entity(hass, config_entry)
+
+    await async_call_panel(hass, config_entry, "alarm_arm_away")
+    assert entity.state == AlarmControlPanelState.ARMING
+    await async_call_panel(hass, config_entry, "alarm_disarm")
+    assert entity.state == AlarmControlPanelState.DISARMED
+
+    await async_advance(hass, freezer, 31)
+    assert entity.state == AlarmControlPanelState.DISARMED
+    assert not entity._tasks
+
+
+async def test_delayed_sensor_storm_starts_one_entry_delay(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    config_entry: MockConfigEntry,
+    device_calls: dict[str, list],
+) -> None:
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    entity = panel_entity(hass, config_entry)
+
+    await async_call_panel(hass, config_entry, "alarm_arm_away")
+    await async_advance(hass, freezer, 31)
+    for _ in range(50):
+        hass.states.async_set(DELAYED_SENSOR, STATE_ON)
+        hass.states.async_set(DELAYED_SENSOR, STATE_OFF)
+    await async_settle(hass)
+    assert len(entity._tasks) == 1
+
+    await async_call_panel(hass, config_entry, "alarm_disarm")
+    await async_advance(hass, freezer, 16)
+    assert entity.state == AlarmControlPanelState.DISARMED
+    assert not entity._tasks
+    assert not device_calls["siren.turn_on"]
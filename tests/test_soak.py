@@ -0,0 +1,186 @@
+"""Soak test: simulate days of use on a virtual clock and watch for leaks.
+
+Each cycle arms and disarms the panel, storms the sensors, reloads the
+options mid-alarm and lets the arm schedule fire. After every cycle the
+pending tasks, tracked state callbacks, timers, removed entities and
+memory allocated by the integration must be back at their baseline.
+Set ``ALARMCONTROL_SOAK_DAYS`` to run longer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import os
+import tracemalloc
+import weakref
+from datetime import datetime, timedelta
+
+from custom_components.alarmcontrol.const import (
+    CONF_ARM_SCHEDULE_ENABLE,
+    CONF_COOLDOWN,
+    CONF_TIME_END,
+    CONF_TIME_START,
+)
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.alarm_control_panel import AlarmControlPanelState
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .conftest import DELAYED_SENSOR, INSTANT_SENSOR
+from .helpers import async_advance, async_call_panel, async_settle, panel_entity
+
+SOAK_DAYS = int(os.environ.get("ALARMCONTROL_SOAK_DAYS", "2"))
+CYCLES_PER_DAY = 4
+STORM_SIZE = 20
+ARM_AT = 22
+# traced allocations from the integration may wobble, but must not grow with cycles
+MEMORY_SLACK = 64 * 1024
+
+
+def _state_change_callbacks(hass: HomeAssistant) -> dict[str, int]:
+    """Count async_track_state_change_event callbacks per entity_id."""
+    # the keyed tracker's storage moved between Home Assistant releases
+    if (data := hass.data.get("track_state_change_data")) is not None:
+        callbacks = data.callbacks
+    else:
+        callbacks = hass.data.get("track_state_change_callbacks", {})
+    return {entity_id: len(jobs) for entity_id, jobs in callbacks.items() if jobs}
+
+
+def _integration_memory() -> int:
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(
+                True, "*/custom_components/alarmcontrol/*", all_frames=True
+            )
+        ]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def _snapshot(hass: HomeAssistant) -> dict[str, object]:
+    return {
+        "bus_listeners": hass.bus.async_listeners(),
+        "state_callbacks": _state_change_callbacks(hass),
+        "timers": sum(
+            1
+            for handle in hass.loop._scheduled
+            if isinstance(handle, asyncio.TimerHandle) and not handle.cancelled()
+        ),
+        "tasks": len(asyncio.all_tasks()),
+    }
+
+
+def _crosses(start: datetime, end: datetime, hour: int) -> bool:
+    start, end = dt_util.as_local(start), dt_util.as_local(end)
+    mark = start.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if mark <= start:
+        mark += timedelta(days=1)
+    return mark <= end
+
+
+def _entry_tasks(entity) -> int:
+    return sum(1 for task in entity._tasks if task.get_name().endswith("entry_delay"))
+
+
+async def _storm(hass: HomeAssistant, entity_id: str) -> None:
+    for _ in range(STORM_SIZE):
+        hass.states.async_set(entity_id, STATE_ON)
+        hass.states.async_set(entity_id, STATE_OFF)
+    await async_settle(hass)
+
+
+async def _disarm(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    await async_call_panel(hass, entry, "alarm_disarm")
+    assert panel_entity(hass, entry).state == AlarmControlPanelState.DISARMED
+
+
+async def test_soak_returns_to_baseline(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    config_entry: MockConfigEntry,
+    device_calls: dict[str, list],
+) -> None:
+    freezer.move_to("2026-01-01 00:00:00+00:00")
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={
+            **config_entry.options,
+            CONF_ARM_SCHEDULE_ENABLE: True,
+            CONF_TIME_START: f"{ARM_AT}:00:00",
+            CONF_TIME_END: "06:00:00",
+        },
+    )
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    # flush the delayed registry/store writes setup schedules
+    await async_advance(hass, freezer, 600)
+
+    entity = panel_entity(hass, config_entry)
+    baseline = _snapshot(hass)
+    assert INSTANT_SENSOR in baseline["state_callbacks"]
+    removed: list[weakref.ref] = []
+    baseline_memory = 0
+
+    tracemalloc.start(10)
+    try:
+        for cycle in range(SOAK_DAYS * CYCLES_PER_DAY):
+            await async_call_panel(hass, config_entry, "alarm_arm_away")
+            await async_advance(hass, freezer, 31)
+            assert entity.state == AlarmControlPanelState.ARMED_AWAY, f"cycle {cycle}"
+
+            await _storm(hass, INSTANT_SENSOR)
+            await _storm(hass, DELAYED_SENSOR)
+            assert _entry_tasks(entity) <= 1, f"cycle {cycle}: entry delay per edge"
+            await async_advance(hass, freezer, 16)
+
+            # reload while the alarm duration is still running
+            removed.append(weakref.ref(entity))
+            hass.config_entries.async_update_entry(
+                config_entry,
+                options={**config_entry.options, CONF_COOLDOWN: 60 + (cycle + 1) % 2},
+            )
+            await async_settle(hass)
+            entity = panel_entity(hass, config_entry)
+            assert entity is not removed[-1](), f"cycle {cycle}: entry did not reload"
+            # nothing may outlive the old entity, even work that would finish later
+            assert len(asyncio.all_tasks()) == baseline["tasks"], f"cycle {cycle}"
+
+            # disarm inside the exit delay; the pending arm must not fire later
+            await async_call_panel(hass, config_entry, "alarm_arm_night")
+            await _storm(hass, DELAYED_SENSOR)
+            assert _entry_tasks(entity) <= 1, f"cycle {cycle}: entry delay per edge"
+            await _disarm(hass, config_entry)
+            await async_advance(hass, freezer, 60)
+            assert entity.state == AlarmControlPanelState.DISARMED, f"cycle {cycle}"
+
+            # rest of the quarter day; may cross the arm/disarm schedule
+            start = dt_util.utcnow()
+            await async_advance(hass, freezer, 6 * 3600)
+            await async_advance(hass, freezer, 300)
+            expected = (
+                AlarmControlPanelState.ARMED_NIGHT
+                if _crosses(start, dt_util.utcnow(), ARM_AT)
+                else AlarmControlPanelState.DISARMED
+            )
+            assert entity.state == expected, f"cycle {cycle}"
+            await _disarm(hass, config_entry)
+            await async_advance(hass, freezer, 300)
+            assert entity.state == AlarmControlPanelState.DISARMED, f"cycle {cycle}"
+
+            # the service mocks keep every call; that is the test holding memory
+            for calls in device_calls.values():
+                calls.clear()
+            gc.collect()
+            assert not entity._tasks, f"cycle {cycle}: pending entity tasks"
+            assert _snapshot(hass) == baseline, f"cycle {cycle}"
+            assert all(ref() is None for ref in removed), f"cycle {cycle}: entity leak"
+            if cycle == 0:
+                # the first cycle warms caches; measure growth from there
+                baseline_memory = _integration_memory()
+
+        assert _integration_memory() - baseline_memory <= MEMORY_SLACK
+    finally:
+        tracemalloc.stop()